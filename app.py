@@ -1,9 +1,14 @@
 # app.py (validated / corrected)
 import os
 import math
+import re
 import threading
 import traceback
-from PIL import Image, ImageFilter, ImageOps, ImageDraw, ImageFont, ImageTk
+import functools
+import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import PIL
+from PIL import Image, ImageFilter, ImageOps, ImageDraw, ImageFont, ImageTk, features
 import tkinter as tk
 from tkinter import filedialog, colorchooser, messagebox, simpledialog
 from tkinter import ttk
@@ -15,6 +20,27 @@ try:
 except Exception:
     DND_AVAILABLE = False
 
+# Try optional NumPy for vectorized pixel ops (not required)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
+# Try optional OpenCV for SIMD-vectorized downscaling (INTER_AREA); not required
+try:
+    import cv2
+    CV2_AVAILABLE = NUMPY_AVAILABLE
+except Exception:
+    CV2_AVAILABLE = False
+
+# Detect Pillow build: pillow-simd (drop-in, SSE4/AVX2 resize & blur) is versioned "X.Y.Z.postN"
+PILLOW_SIMD = ".post" in PIL.__version__
+try:
+    LIBJPEG_TURBO = bool(features.check_feature("libjpeg_turbo"))
+except Exception:
+    LIBJPEG_TURBO = False
+
 # ----------------- Configuration / presets -----------------
 ASPECT_PRESETS = {
     "1:1": (1, 1),
@@ -27,6 +53,24 @@ ASPECT_PRESETS = {
 
 DEFAULT_OUTPUT_DIR = os.path.join(os.getcwd(), "output")
 
+# Tk DnD file lists: paths with spaces are wrapped in {braces}, others are space-separated
+DND_FILENAME_RE = re.compile(r"\{([^}]*)\}|(\S+)")
+
+PREVIEW_SIZE = (700, 460)
+
+# Full-resolution images kept from preview for reuse by save/batch. Previews draft-decode JPEGs larger
+# than ~2x PREVIEW_SIZE (about 1400x920) at reduced scale; those are NOT cached, since a drafted image
+# would produce wrong-size output. In practice only smaller JPEGs and PNG/BMP/WebP files get reused.
+DECODED_CACHE_SIZE = 8
+
+BLUR_DOWNSCALE = 8  # blurred backgrounds are built at 1/BLUR_DOWNSCALE resolution
+
+RESAMPLE_FILTERS = {
+    "lanczos": Image.LANCZOS,
+    "bicubic": Image.BICUBIC,
+    "bilinear": Image.BILINEAR,
+}
+
 # ----------------- Image utility functions -----------------
 def compute_canvas_size(w, h, a, b):
     """Compute minimal integer canvas dimensions with aspect a:b so that canvas_w >= w & canvas_h >= h."""
@@ -37,25 +81,56 @@ def compute_canvas_size(w, h, a, b):
     canvas_h = int(math.ceil(k * b))
     return canvas_w, canvas_h
 
-def create_blurred_background(img, canvas_size, blur_radius=25):
-    """Create blurred background from image by resizing to cover and center-cropping, then blurring."""
+def pillow_build_info():
+    """Short description of the Pillow build in use (for the log pane)."""
+    flavour = "pillow-simd" if PILLOW_SIMD else "Pillow"
+    jpeg = "libjpeg-turbo" if LIBJPEG_TURBO else "libjpeg"
+    return f"{flavour} {PIL.__version__} ({jpeg})"
+
+def ensure_mode(im, mode="RGB"):
+    """Return a loaded image in the given mode, skipping the convert() copy when it already matches."""
+    if im.mode == mode:
+        im.load()  # single-frame files release their file handle once loaded
+        return im
+    with im:
+        return im.convert(mode)
+
+def _resize(img, size, resample):
+    """Resize img to size. Downscales of RGB images go through OpenCV's INTER_AREA when available,
+       which is faster than Pillow's convolution filters there; upscales stay on Pillow (on par or faster).
+       Note: when OpenCV handles a downscale, INTER_AREA overrides the requested resample filter.
+    """
+    if CV2_AVAILABLE and img.mode == "RGB" and size[0] <= img.width and size[1] <= img.height:
+        return Image.fromarray(cv2.resize(np.asarray(img), size, interpolation=cv2.INTER_AREA), "RGB")
+    return img.resize(size, resample)
+
+def create_blurred_background(img, canvas_size, blur_radius=25, resample=Image.LANCZOS, downscale=BLUR_DOWNSCALE):
+    """Create blurred background from image by resizing to cover and center-cropping, then blurring.
+       The cover is built and blurred at 1/downscale resolution (radius scaled to match) and then
+       upscaled, which looks the same for a heavy blur but touches far fewer pixels.
+    """
     canvas_w, canvas_h = canvas_size
+    small_w = max(1, canvas_w // downscale)
+    small_h = max(1, canvas_h // downscale)
     w, h = img.size
-    scale = max(canvas_w / w, canvas_h / h)
-    cover_size = (int(round(w * scale)), int(round(h * scale)))
-    cover = img.resize(cover_size, Image.LANCZOS)
-    left = (cover.width - canvas_w) // 2
-    top = (cover.height - canvas_h) // 2
-    cover = cover.crop((left, top, left + canvas_w, top + canvas_h))
-    blurred = cover.filter(ImageFilter.GaussianBlur(radius=blur_radius))
-    return blurred
-
-def compose_fit_canvas(img, aspect_a, aspect_b, bg_mode, bg_color):
+    scale = max(small_w / w, small_h / h)
+    cover_size = (max(small_w, int(round(w * scale))), max(small_h, int(round(h * scale))))
+    cover = _resize(img, cover_size, resample)
+    left = (cover.width - small_w) // 2
+    top = (cover.height - small_h) // 2
+    cover = cover.crop((left, top, left + small_w, top + small_h))
+    blurred = cover.filter(ImageFilter.GaussianBlur(radius=blur_radius / downscale))
+    return blurred.resize((canvas_w, canvas_h), Image.BILINEAR)
+
+def compose_fit_canvas(img, aspect_a, aspect_b, bg_mode, bg_color, resample=Image.LANCZOS):
     """Fit mode: keep full image and center it on canvas sized to aspect (no crop)."""
     w, h = img.size
     canvas_w, canvas_h = compute_canvas_size(w, h, aspect_a, aspect_b)
     if bg_mode == "blur":
-        bg = create_blurred_background(img, (canvas_w, canvas_h))
+        # The background only needs ~2x its blur resolution, so box-reduce the source first
+        factor = min(w * BLUR_DOWNSCALE // canvas_w, h * BLUR_DOWNSCALE // canvas_h) // 2
+        small = img.reduce(factor) if factor > 1 else img
+        bg = create_blurred_background(small, (canvas_w, canvas_h), resample=resample)
     else:
         bg = Image.new("RGB", (canvas_w, canvas_h), bg_color)
     offset_x = (canvas_w - w) // 2
@@ -63,16 +138,27 @@ def compose_fit_canvas(img, aspect_a, aspect_b, bg_mode, bg_color):
     bg.paste(img, (offset_x, offset_y))
     return bg
 
-def compose_fill_canvas(img, aspect_a, aspect_b, bg_mode, bg_color):
-    """Fill mode: scale to cover canvas and center-crop (may crop parts)."""
-    w, h = img.size
+def fill_geometry(w, h, aspect_a, aspect_b):
+    """Fill-mode geometry for a w x h source: (canvas size, centred source box to resize from)."""
     canvas_w, canvas_h = compute_canvas_size(w, h, aspect_a, aspect_b)
-    scale = max(canvas_w / w, canvas_h / h)
-    new_size = (int(round(w * scale)), int(round(h * scale)))
-    resized = img.resize(new_size, Image.LANCZOS)
-    left = (resized.width - canvas_w) // 2
-    top = (resized.height - canvas_h) // 2
-    return resized.crop((left, top, left + canvas_w, top + canvas_h))
+    ratio = canvas_w / canvas_h
+    if w / h >= ratio:
+        crop_w, crop_h = h * ratio, h
+    else:
+        crop_w, crop_h = w, w / ratio
+    left = (w - crop_w) / 2
+    top = (h - crop_h) / 2
+    return (canvas_w, canvas_h), (left, top, left + crop_w, top + crop_h)
+
+def compose_fill_canvas(img, aspect_a, aspect_b, bg_mode, bg_color, resample=Image.LANCZOS, geometry=None):
+    """Fill mode: scale to cover canvas and center-crop (may crop parts).
+       Only the source region that survives the crop is resized (same as ImageOps.fit).
+       geometry may be passed in from fill_geometry() to reuse it across same-sized images.
+    """
+    if geometry is None:
+        geometry = fill_geometry(img.width, img.height, aspect_a, aspect_b)
+    canvas_size, box = geometry
+    return img.resize(canvas_size, resample, box=box)
 
 def compose_stretch_canvas(img, aspect_a, aspect_b, bg_mode, bg_color):
     """Stretch mode: force image to canvas size (distorts)."""
@@ -96,90 +182,126 @@ def ImageColor_getrgb_safe(color_str):
     # fallback white
     return (255, 255, 255)
 
-def apply_text_watermark(base_img, text, position, opacity, font_size, color):
-    """Overlay text watermark. Returns new image (RGB)."""
-    if not text:
-        return base_img
-    base = base_img.convert("RGBA")
-    txt_layer = Image.new("RGBA", base.size, (255,255,255,0))
-    draw = ImageDraw.Draw(txt_layer)
-
-    # Try to load a truetype font; fall back to default
+@functools.lru_cache(maxsize=32)
+def _get_font(size):
+    """Load (once per size) a truetype font; fall back to default."""
     try:
-        font = ImageFont.truetype("arial.ttf", font_size)
+        return ImageFont.truetype("arial.ttf", size)
     except Exception:
-        font = ImageFont.load_default()
+        return ImageFont.load_default()
 
-    # Pillow's textbbox may not exist on very old versions; handle gracefully
+def _build_text_wm_layer(size, text, position, opacity, font_size, color):
+    """Render a text watermark for a canvas of the given size.
+       Returns (tile, (x, y)): an RGBA tile just big enough for the text and where to paste it.
+    """
+    width, height = size
+    font = _get_font(font_size)
+
+    # Measure on a 1x1 scratch image; Pillow's textbbox may not exist on very old versions
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
     try:
         text_bbox = draw.textbbox((0,0), text, font=font)
-        text_w = text_bbox[2] - text_bbox[0]
-        text_h = text_bbox[3] - text_bbox[1]
     except Exception:
-        text_w, text_h = draw.textsize(text, font=font)
+        text_bbox = (0, 0) + tuple(draw.textsize(text, font=font))
+    text_w = text_bbox[2] - text_bbox[0]
+    text_h = text_bbox[3] - text_bbox[1]
 
-    margin = int(max(8, base.width * 0.02))
+    margin = int(max(8, width * 0.02))
     if position == "bottom-right":
-        x = base.width - text_w - margin
-        y = base.height - text_h - margin
+        x = width - text_w - margin
+        y = height - text_h - margin
     elif position == "bottom-left":
         x = margin
-        y = base.height - text_h - margin
+        y = height - text_h - margin
     elif position == "top-left":
         x = margin
         y = margin
     elif position == "top-right":
-        x = base.width - text_w - margin
+        x = width - text_w - margin
         y = margin
     else:  # center
-        x = (base.width - text_w) // 2
-        y = (base.height - text_h) // 2
+        x = (width - text_w) // 2
+        y = (height - text_h) // 2
 
     r, g, b = ImageColor_getrgb_safe(color)
     alpha = int(255 * (opacity / 100.0))
-    draw.text((x, y), text, font=font, fill=(r, g, b, alpha))
-    combined = Image.alpha_composite(base, txt_layer).convert("RGB")
-    return combined
-
-def apply_logo_watermark(base_img, logo_img, position, opacity, scale_ratio=0.15, margin_ratio=0.02):
-    """Overlay logo (logo_img) onto base_img with given opacity and position.
-       scale_ratio = fraction of base image width used for logo width.
+    # Small transparent pad so antialiased edges/overhanging glyphs are never clipped by the tile
+    pad = 2
+    tile = Image.new("RGBA", (max(1, text_w) + 2 * pad, max(1, text_h) + 2 * pad), (255,255,255,0))
+    ImageDraw.Draw(tile).text((pad - text_bbox[0], pad - text_bbox[1]), text, font=font, fill=(r, g, b, alpha))
+    return tile, (x + text_bbox[0] - pad, y + text_bbox[1] - pad)
+
+def _build_logo_wm_layer(size, logo_img, position, opacity, scale_ratio=0.15, margin_ratio=0.02):
+    """Scale and opacity-adjust a logo for a canvas of the given size.
+       Returns (tile, (x, y)): the RGBA logo and where to paste it.
     """
-    if logo_img is None:
-        return base_img
-    base = base_img.convert("RGBA")
-    logo = logo_img.convert("RGBA")
+    width, height = size
+    logo = logo_img if logo_img.mode == "RGBA" else logo_img.convert("RGBA")
 
-    target_w = max(1, int(base.width * scale_ratio))
+    target_w = max(1, int(width * scale_ratio))
     scale = target_w / logo.width
     new_size = (max(1, int(logo.width * scale)), max(1, int(logo.height * scale)))
     logo = logo.resize(new_size, Image.LANCZOS)
 
     if opacity < 100:
-        alpha = logo.split()[3].point(lambda p: int(p * (opacity / 100.0)))
-        logo.putalpha(alpha)
+        if NUMPY_AVAILABLE:
+            arr = np.array(logo)
+            arr[..., 3] = arr[..., 3].astype(np.uint16) * int(opacity) // 100
+            logo = Image.fromarray(arr, "RGBA")
+        else:
+            alpha = logo.split()[3].point(lambda p: p * int(opacity) // 100)
+            logo.putalpha(alpha)
 
-    margin = int(max(8, base.width * margin_ratio))
+    margin = int(max(8, width * margin_ratio))
     if position == "bottom-right":
-        x = base.width - logo.width - margin
-        y = base.height - logo.height - margin
+        x = width - logo.width - margin
+        y = height - logo.height - margin
     elif position == "bottom-left":
         x = margin
-        y = base.height - logo.height - margin
+        y = height - logo.height - margin
     elif position == "top-left":
         x = margin
         y = margin
     elif position == "top-right":
-        x = base.width - logo.width - margin
+        x = width - logo.width - margin
         y = margin
     else:  # center
-        x = (base.width - logo.width) // 2
-        y = (base.height - logo.height) // 2
+        x = (width - logo.width) // 2
+        y = (height - logo.height) // 2
+
+    return logo, (x, y)
+
+def composite_wm_layer(base_img, layer, in_place=False):
+    """Paste a prebuilt (tile, (x, y)) watermark over base_img using the tile's alpha as mask,
+       so only the watermark rectangle is blended. Pasting straight onto the RGB image avoids
+       an RGB -> RGBA -> RGB round-trip of the whole canvas.
+       Returns base_img itself when in_place is set (and it is RGB), else a new RGB image.
+    """
+    tile, xy = layer
+    if base_img.mode != "RGB":
+        base = base_img.convert("RGB")
+    elif in_place:
+        base = base_img
+    else:
+        base = base_img.copy()
+    base.paste(tile, xy, tile)
+    return base
+
+def apply_text_watermark(base_img, text, position, opacity, font_size, color):
+    """Overlay text watermark. Returns new image (RGB)."""
+    if not text:
+        return base_img
+    layer = _build_text_wm_layer(base_img.size, text, position, opacity, font_size, color)
+    return composite_wm_layer(base_img, layer)
 
-    tmp = Image.new("RGBA", base.size, (255,255,255,0))
-    tmp.paste(logo, (x, y), logo)
-    combined = Image.alpha_composite(base, tmp).convert("RGB")
-    return combined
+def apply_logo_watermark(base_img, logo_img, position, opacity, scale_ratio=0.15, margin_ratio=0.02):
+    """Overlay logo (logo_img) onto base_img with given opacity and position.
+       scale_ratio = fraction of base image width used for logo width.
+    """
+    if logo_img is None:
+        return base_img
+    layer = _build_logo_wm_layer(base_img.size, logo_img, position, opacity, scale_ratio, margin_ratio)
+    return composite_wm_layer(base_img, layer)
 
 # ----------------- GUI Application -----------------
 class ResizerApp:
@@ -191,12 +313,15 @@ class ResizerApp:
         # state
         self.files = []
         self.current_image = None
+        self._preview_tk = None
+        self._decoded_cache = collections.OrderedDict()  # path -> decoded RGB image (LRU)
         self.bg_color = "#000000"
         self.bg_mode = tk.StringVar(value="color")
         self.mode = tk.StringVar(value="fit")
         self.aspect_var = tk.StringVar(value="1:1")
         self.custom_aspect_w = tk.StringVar(value="1")
         self.custom_aspect_h = tk.StringVar(value="1")
+        self.resample_filter = tk.StringVar(value="lanczos")
 
         # watermark state
         self.wm_type = tk.StringVar(value="none")
@@ -205,7 +330,10 @@ class ResizerApp:
         self.wm_position = tk.StringVar(value="bottom-right")
         self.wm_opacity = tk.IntVar(value=80)
         self.wm_font_size = tk.IntVar(value=32)
+        self._wm_cache = {}  # (canvas size, watermark params) -> (tile, (x, y)), reset per batch
+        self._geom_cache = {}  # (w, h, a, b) -> fill_geometry(), reset per batch
         self.output_dir = tk.StringVar(value=DEFAULT_OUTPUT_DIR)
+        self.optimize_jpeg = tk.BooleanVar(value=False)
 
         # Top controls
         top_frame = tk.Frame(root, padx=8, pady=8)
@@ -275,6 +403,13 @@ class ResizerApp:
         tk.Radiobutton(control_frame, text="Fill (crop)", variable=self.mode, value="fill").pack(anchor="w")
         tk.Radiobutton(control_frame, text="Stretch (distort)", variable=self.mode, value="stretch").pack(anchor="w")
 
+        resample_frame = tk.Frame(control_frame)
+        tk.Label(resample_frame, text="Resample (fill):").pack(side=tk.LEFT)
+        resample_menu = tk.OptionMenu(resample_frame, self.resample_filter, *RESAMPLE_FILTERS.keys())
+        resample_menu.config(width=10)
+        resample_menu.pack(side=tk.LEFT)
+        resample_frame.pack(anchor="w", pady=4)
+
         # Background options
         tk.Label(control_frame, text="Background").pack(anchor="w", pady=(8,0))
         tk.Radiobutton(control_frame, text="Solid Color", variable=self.bg_mode, value="color").pack(anchor="w")
@@ -311,6 +446,8 @@ class ResizerApp:
         tk.Label(control_frame, text="Font size (text wm)").pack(anchor="w")
         tk.Scale(control_frame, from_=12, to=96, orient=tk.HORIZONTAL, variable=self.wm_font_size).pack(fill=tk.X)
 
+        tk.Checkbutton(control_frame, text="Smaller files (slower batch save)", variable=self.optimize_jpeg).pack(anchor="w", pady=(8,0))
+
         # Save button (batch)
         save_btn = tk.Button(
             control_frame,
@@ -356,6 +493,7 @@ class ResizerApp:
         self.progress.pack(pady=6)
         self.log_text = tk.Text(right_frame, height=8)
         self.log_text.pack(fill=tk.X, pady=4)
+        self.log(f"Using {pillow_build_info()}")
 
     # ---------- File operations ----------
     def load_images(self):
@@ -389,6 +527,7 @@ class ResizerApp:
 
     def clear_list(self):
         self.files.clear()
+        self._decoded_cache.clear()
         self.file_listbox.delete(0, tk.END)
         self.preview_label.config(image="", text="Drop images here (or load)")
         self.log("Cleared file list.")
@@ -434,26 +573,8 @@ class ResizerApp:
         self.add_files(paths)
 
     def _parse_dnd_filenames(self, raw):
-        parts = []
-        cur = ""
-        in_brace = False
-        for ch in raw:
-            if ch == "{":
-                in_brace = True
-                cur = ""
-            elif ch == "}":
-                in_brace = False
-                parts.append(cur)
-                cur = ""
-            elif ch == " " and not in_brace:
-                if cur:
-                    parts.append(cur)
-                    cur = ""
-            else:
-                cur += ch
-        if cur:
-            parts.append(cur)
-        return [p for p in parts if os.path.isfile(p)]
+        parts = [braced or bare for braced, bare in DND_FILENAME_RE.findall(raw)]
+        return [p for p in parts if p and os.path.isfile(p)]
 
     # ---------- Listbox select ----------
     def on_select_listbox(self, event):
@@ -463,18 +584,36 @@ class ResizerApp:
         idx = sel[0]
         path = self.files[idx]
         try:
-            img = Image.open(path).convert("RGB")
+            # Let libjpeg decode at reduced scale; the preview only needs ~2x the label size
+            im = Image.open(path)
+            full_size = im.size
+            im.draft("RGB", (PREVIEW_SIZE[0] * 2, PREVIEW_SIZE[1] * 2))
+            img = ensure_mode(im)
             self.current_image = img
-            self.display_preview(img)
+            if img.size == full_size:
+                # Full-resolution decode: keep it for reuse by save/batch
+                self._decoded_cache[path] = img
+                self._decoded_cache.move_to_end(path)
+                while len(self._decoded_cache) > DECODED_CACHE_SIZE:
+                    self._decoded_cache.popitem(last=False)
+                self.display_preview(img)
+            else:
+                self.display_preview(img, in_place=True)
         except Exception as e:
             self.log(f"Failed to open {path}: {e}")
 
-    def display_preview(self, pil_img):
-        max_w, max_h = 700, 460
-        preview = pil_img.copy()
-        preview.thumbnail((max_w, max_h), Image.LANCZOS)
+    def display_preview(self, pil_img, in_place=False):
+        preview = pil_img if in_place else pil_img.copy()
+        preview.thumbnail(PREVIEW_SIZE, Image.BILINEAR)
+        if preview.mode != "RGB":
+            preview = preview.convert("RGB")
         try:
-            self._preview_tk = ImageTk.PhotoImage(preview)
+            # ImageTk copies straight from the pixel buffer; reuse the Tk photo when the size is unchanged
+            tk_img = self._preview_tk
+            if tk_img is not None and (tk_img.width(), tk_img.height()) == preview.size:
+                tk_img.paste(preview)
+            else:
+                self._preview_tk = ImageTk.PhotoImage(preview)
             self.preview_label.config(image=self._preview_tk, text="")
         except Exception:
             self.preview_label.config(text="Preview not available")
@@ -501,53 +640,166 @@ class ResizerApp:
         if not proceed:
             return
 
-        thread = threading.Thread(target=self._batch_process_thread, args=(out_dir,))
+        # Tk variables must only be read on the main thread, so snapshot everything the workers need here
+        settings = self._batch_settings()
+        if settings is None:
+            return
+        thread = threading.Thread(target=self._batch_process_thread, args=(list(self.files), out_dir, settings))
         thread.start()
 
-    def _batch_process_thread(self, out_dir):
-        total = len(self.files)
-        self.progress["maximum"] = total
-        self.progress["value"] = 0
-        success = 0
-        for i, path in enumerate(list(self.files), start=1):
+    def _batch_settings(self):
+        """Read the current UI settings once per batch (and load the logo once, if any).
+           Returns None if the selected logo cannot be opened.
+        """
+        a, b = self.get_aspect()
+        settings = {
+            "aspect": (a, b),
+            "mode": self.mode.get(),
+            "bg_mode": self.bg_mode.get(),
+            "bg_color": self.bg_color,
+            "resample": RESAMPLE_FILTERS.get(self.resample_filter.get(), Image.LANCZOS),
+            "wm_type": self.wm_type.get(),
+            "wm_text": self.wm_text.get().strip(),
+            "wm_position": self.wm_position.get(),
+            "wm_opacity": self.wm_opacity.get(),
+            "wm_font_size": self.wm_font_size.get(),
+            "wm_logo_path": self.wm_logo_path,
+            "optimize_jpeg": self.optimize_jpeg.get(),
+            "wm_logo": None,
+        }
+        logo_path = settings["wm_logo_path"]
+        if settings["wm_type"] == "logo" and logo_path and os.path.isfile(logo_path):
             try:
-                self.log(f"[{i}/{total}] Processing: {path}")
-                img = Image.open(path).convert("RGB")
-                a, b = self.get_aspect()
-                mode = self.mode.get()
-                bg_mode = self.bg_mode.get()
-                bg_color = self.bg_color
-
-                if mode == "fit":
-                    out_img = compose_fit_canvas(img, a, b, bg_mode, bg_color)
-                elif mode == "fill":
-                    out_img = compose_fill_canvas(img, a, b, bg_mode, bg_color)
-                elif mode == "stretch":
-                    out_img = compose_stretch_canvas(img, a, b, bg_mode, bg_color)
-                else:
-                    raise RuntimeError("Unknown mode")
-
-                if self.wm_type.get() == "text" and self.wm_text.get().strip():
-                    out_img = apply_text_watermark(out_img, self.wm_text.get().strip(),
-                                                   self.wm_position.get(), self.wm_opacity.get(), self.wm_font_size.get(), "#ffffff")
-                elif self.wm_type.get() == "logo" and self.wm_logo_path and os.path.isfile(self.wm_logo_path):
-                    logo = Image.open(self.wm_logo_path).convert("RGBA")
-                    out_img = apply_logo_watermark(out_img, logo, self.wm_position.get(), self.wm_opacity.get())
-
-                fname = os.path.splitext(os.path.basename(path))[0]
-                out_name = f"{fname}_resized.jpg"
-                out_path = os.path.join(out_dir, out_name)
-                out_img.save(out_path, "JPEG", quality=95, optimize=True)
-                self.log(f"Saved → {out_path}")
-                success += 1
+                settings["wm_logo"] = ensure_mode(Image.open(logo_path), "RGBA")
             except Exception as e:
-                self.log(f"Error processing {path}: {e}\n{traceback.format_exc()}")
-            finally:
-                self.progress["value"] = i
+                self.log(f"Failed to open logo {logo_path}: {e}")
+                messagebox.showerror("Logo error", f"Could not open logo:\n{logo_path}\n\n{e}\n\nBatch not started.")
+                return None
+        return settings
 
-        messagebox.showinfo("Batch complete", f"Processed {success}/{total} files.\nSaved to: {out_dir}")
+    def _batch_process_thread(self, paths, out_dir, settings):
+        total = len(paths)
+        self._ui(self._reset_progress, total)
+
+        self._wm_cache = {}
+        self._geom_cache = {}
+        success = 0
+        done = 0
+        workers = min(total, os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._process_one, path, out_path, settings)
+                       for path, out_path in zip(paths, self._output_paths(paths, out_dir))]
+            for future in as_completed(futures):
+                path, out_path, err = future.result()
+                done += 1
+                if err is None:
+                    success += 1
+                    self._ui(self.log, f"[{done}/{total}] Saved → {out_path}")
+                else:
+                    self._ui(self.log, f"[{done}/{total}] Error processing {path}: {err}")
+                self._ui(self.progress.configure, value=done)
+
+        self._ui(self._finish_batch, success, total, out_dir)
+
+    def _output_paths(self, paths, out_dir):
+        """Map each input to <stem>_resized.jpg in out_dir, adding _2, _3, ... when stems repeat
+           (load_folder recurses, so d1/IMG.jpg and d2/IMG.jpg can both be in the list).
+           Unique names keep parallel workers from writing the same file.
+        """
+        used = set()
+        out_paths = []
+        for path in paths:
+            fname = os.path.splitext(os.path.basename(path))[0]
+            out_name = f"{fname}_resized.jpg"
+            n = 1
+            while os.path.normcase(out_name) in used:
+                n += 1
+                out_name = f"{fname}_resized_{n}.jpg"
+            used.add(os.path.normcase(out_name))
+            out_paths.append(os.path.join(out_dir, out_name))
+        return out_paths
+
+    def _process_one(self, path, out_path, settings):
+        """Open → compose → watermark → save a single file. Returns (path, out_path, err)."""
+        try:
+            a, b = settings["aspect"]
+            img = self._load_source(path)
+            mode = settings["mode"]
+            bg_mode = settings["bg_mode"]
+            bg_color = settings["bg_color"]
+            resample = settings["resample"]
+
+            if mode == "fit":
+                out_img = compose_fit_canvas(img, a, b, bg_mode, bg_color, resample=resample)
+            elif mode == "fill":
+                key = (img.width, img.height, a, b)
+                geometry = self._geom_cache.get(key)
+                if geometry is None:
+                    geometry = self._geom_cache[key] = fill_geometry(img.width, img.height, a, b)
+                out_img = compose_fill_canvas(img, a, b, bg_mode, bg_color, resample=resample, geometry=geometry)
+            elif mode == "stretch":
+                out_img = compose_stretch_canvas(img, a, b, bg_mode, bg_color)
+            else:
+                raise RuntimeError("Unknown mode")
+
+            layer = self._get_wm_layer(out_img.size, settings)
+            if layer is not None:
+                # out_img is freshly composed, so the watermark can go straight onto it
+                out_img = composite_wm_layer(out_img, layer, in_place=True)
+
+            out_img.save(out_path, "JPEG", quality=95, optimize=settings["optimize_jpeg"],
+                         subsampling=2, progressive=False)
+
+            # Free pixel buffers now so parallel workers don't each hold source + output until GC.
+            # Images shared through the preview cache must stay usable.
+            try:
+                if img is not self._decoded_cache.get(path):
+                    img.close()
+                out_img.close()
+            except Exception:
+                pass
+            return path, out_path, None
+        except Exception as e:
+            return path, None, f"{e}\n{traceback.format_exc()}"
+
+    def _load_source(self, path):
+        """Reuse the image decoded for preview if still cached, else decode from disk."""
+        img = self._decoded_cache.get(path)
+        if img is None:
+            img = ensure_mode(Image.open(path))
+        return img
+
+    def _get_wm_layer(self, size, settings):
+        """Return the batch watermark layer for a canvas size, building it once per distinct size."""
+        wm_type = settings["wm_type"]
+        if wm_type == "text" and settings["wm_text"]:
+            key = (size, wm_type, settings["wm_text"], settings["wm_position"], settings["wm_opacity"], settings["wm_font_size"])
+        elif wm_type == "logo" and settings["wm_logo"] is not None:
+            key = (size, wm_type, settings["wm_logo_path"], settings["wm_position"], settings["wm_opacity"])
+        else:
+            return None
+        layer = self._wm_cache.get(key)
+        if layer is None:
+            if wm_type == "text":
+                layer = _build_text_wm_layer(size, settings["wm_text"], settings["wm_position"],
+                                             settings["wm_opacity"], settings["wm_font_size"], "#ffffff")
+            else:
+                layer = _build_logo_wm_layer(size, settings["wm_logo"], settings["wm_position"], settings["wm_opacity"])
+            self._wm_cache[key] = layer
+        return layer
+
+    def _ui(self, func, *args, **kwargs):
+        """Schedule a callable on the Tk main loop (safe to call from worker threads)."""
+        self.root.after(0, lambda: func(*args, **kwargs))
+
+    def _reset_progress(self, total):
+        self.progress["maximum"] = total
+        self.progress["value"] = 0
+
+    def _finish_batch(self, success, total, out_dir):
         self.log(f"Batch finished: {success}/{total}")
         self.progress["value"] = 0
+        messagebox.showinfo("Batch complete", f"Processed {success}/{total} files.\nSaved to: {out_dir}")
 
     def save_single_selected(self):
         sel = self.file_listbox.curselection()
@@ -557,16 +809,17 @@ class ResizerApp:
         idx = sel[0]
         path = self.files[idx]
         try:
-            img = Image.open(path).convert("RGB")
             a, b = self.get_aspect()
+            img = self._load_source(path)
             mode = self.mode.get()
             bg_mode = self.bg_mode.get()
             bg_color = self.bg_color
+            resample = RESAMPLE_FILTERS.get(self.resample_filter.get(), Image.LANCZOS)
 
             if mode == "fit":
-                out_img = compose_fit_canvas(img, a, b, bg_mode, bg_color)
+                out_img = compose_fit_canvas(img, a, b, bg_mode, bg_color, resample=resample)
             elif mode == "fill":
-                out_img = compose_fill_canvas(img, a, b, bg_mode, bg_color)
+                out_img = compose_fill_canvas(img, a, b, bg_mode, bg_color, resample=resample)
             elif mode == "stretch":
                 out_img = compose_stretch_canvas(img, a, b, bg_mode, bg_color)
             else:
@@ -576,7 +829,7 @@ class ResizerApp:
                 out_img = apply_text_watermark(out_img, self.wm_text.get().strip(),
                                                self.wm_position.get(), self.wm_opacity.get(), self.wm_font_size.get(), "#ffffff")
             elif self.wm_type.get() == "logo" and self.wm_logo_path and os.path.isfile(self.wm_logo_path):
-                logo = Image.open(self.wm_logo_path).convert("RGBA")
+                logo = ensure_mode(Image.open(self.wm_logo_path), "RGBA")
                 out_img = apply_logo_watermark(out_img, logo, self.wm_position.get(), self.wm_opacity.get())
 
             # ask where to save single file